@@ -5,54 +5,189 @@ Benchmark different cryptographic libraries for full Bitcoin address generation
 
 import time
 import os
-import binascii
 import hashlib
 import sys
+import concurrent.futures
+
+# Try to import based58 (Rust-backed base58check) for address encoding
+try:
+    import based58
+    BASED58_AVAILABLE = True
+except ImportError:
+    BASED58_AVAILABLE = False
+
+# Otherwise try to import Numba to JIT-compile the base58 encoder
+NUMBA_AVAILABLE = False
+if not BASED58_AVAILABLE:
+    try:
+        import numpy as np
+        from numba import njit, types
+        NUMBA_AVAILABLE = True
+    except ImportError:
+        pass
 
 # Number of addresses to generate for benchmarking
 NUM_ADDRESSES = 1000
 
+# Threads for the separate threaded coincurve run; cffi releases the GIL around C calls
+NUM_THREADS = os.cpu_count() or 1
+
 def generate_private_keys(num_keys):
-    """Generate random private keys"""
-    return [binascii.hexlify(os.urandom(32)).decode('utf-8').upper() 
-            for _ in range(num_keys)]
+    """Generate random private keys as one contiguous buffer of 32-byte secrets"""
+    return memoryview(os.urandom(32 * num_keys))
 
-def public_key_to_address(public_key):
-    """Convert public key to Bitcoin address"""
+def iter_private_keys(private_keys):
+    """Yield each 32-byte private key from the buffer without copying"""
+    for i in range(0, len(private_keys), 32):
+        yield private_keys[i:i + 32]
+
+def split_private_keys(private_keys, num_chunks):
+    """Split the key buffer into up to num_chunks zero-copy chunks of whole keys"""
+    num_keys = len(private_keys) // 32
+    step = max(1, -(-num_keys // num_chunks)) * 32
+    return [private_keys[i:i + step] for i in range(0, len(private_keys), step)]
+
+BASE58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+
+def base58_encode(payload):
+    """Base58 encode a versioned payload including its checksum"""
     output = []
-    alphabet = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-    var = hashlib.new('ripemd160')
-    encoding = binascii.unhexlify(public_key.encode())
-    var.update(hashlib.sha256(encoding).digest())
-    var_encoded = ('00' + var.hexdigest()).encode()
-    digest = hashlib.sha256(binascii.unhexlify(var_encoded)).digest()
-    var_hex = '00' + var.hexdigest() + hashlib.sha256(digest).hexdigest()[0:8]
-    count = [char != '0' for char in var_hex].index(True) // 2
-    n = int(var_hex, 16)
+    count = len(payload) - len(payload.lstrip(b'\x00'))
+    n = int.from_bytes(payload, 'big')
     while n > 0:
         n, remainder = divmod(n, 58)
-        output.append(alphabet[remainder])
-    for i in range(count): output.append(alphabet[0])
+        output.append(BASE58_ALPHABET[remainder])
+    for i in range(count): output.append(BASE58_ALPHABET[0])
     return ''.join(output[::-1])
 
+# Length of a version byte + RIPEMD-160 + checksum payload, and of its base58 form
+PAYLOAD_LENGTH = 25
+MAX_ADDRESS_LENGTH = 35
+
+if NUMBA_AVAILABLE:
+    _B58_ALPHABET = np.frombuffer(BASE58_ALPHABET.encode('ascii'), dtype=np.uint8)
+    
+    # Payloads come from np.frombuffer over bytes, so they are read-only arrays.
+    # Explicit signatures compile these at import so the benchmark never times the JIT.
+    _PAYLOAD = types.Array(types.uint8, 1, 'C', readonly=True)
+    _PAYLOADS = types.Array(types.uint8, 2, 'C', readonly=True)
+    
+    @njit(types.int64(_PAYLOAD, types.uint8[::1]), cache=True)
+    def payload_to_base58(payload, out):
+        """
+        Base58 encode a 25-byte payload into out, returning the number of characters.
+        
+        The payload is held as seven 32-bit limbs in uint64 slots, so each step of
+        the long division by 58 fits in 64 bits.
+        """
+        limbs = np.zeros(7, dtype=np.uint64)
+        for i in range(25):
+            bit = (24 - i) * 8
+            limbs[6 - bit // 32] |= np.uint64(payload[i]) << np.uint64(bit % 32)
+        
+        zeros = 0
+        for i in range(25):
+            if payload[i] != 0:
+                break
+            zeros += 1
+        
+        digits = np.empty(MAX_ADDRESS_LENGTH, dtype=np.uint8)
+        count = 0
+        start = 0
+        while start < 7:
+            if limbs[start] == 0:
+                start += 1
+                continue
+            remainder = np.uint64(0)
+            for j in range(start, 7):
+                current = (remainder << np.uint64(32)) | limbs[j]
+                limbs[j] = current // np.uint64(58)
+                remainder = current % np.uint64(58)
+            digits[count] = _B58_ALPHABET[remainder]
+            count += 1
+        
+        for i in range(zeros):
+            out[i] = _B58_ALPHABET[0]
+        for i in range(count):
+            out[zeros + i] = digits[count - 1 - i]
+        return zeros + count
+    
+    @njit(types.void(_PAYLOADS, types.uint8[:, ::1], types.int64[::1]), cache=True)
+    def payloads_to_base58(payloads, out, lengths):
+        """Base58 encode every row of an (N, 25) payload array"""
+        for i in range(payloads.shape[0]):
+            lengths[i] = payload_to_base58(payloads[i], out[i])
+
+def sha256d_checksum(data):
+    """Return the 4-byte double SHA-256 checksum of data"""
+    return hashlib.sha256(hashlib.sha256(data).digest()).digest()[:4]
+
+# Looked up once: hashlib.new('ripemd160') resolves the algorithm by name through
+# OpenSSL's provider tables on every call, while copying a blank context does not
+_RIPEMD160 = hashlib.new('ripemd160')
+
+def hash160(data):
+    """Return the RIPEMD-160 of the SHA-256 of data"""
+    ripemd160 = _RIPEMD160.copy()
+    ripemd160.update(hashlib.sha256(data).digest())
+    return ripemd160.digest()
+
+def pubkey_to_address_payload(pubkey):
+    """
+    Return the 25-byte address payload (version || hash160 || checksum) for a public key.
+    
+    SHA-256, RIPEMD-160 and the double SHA-256 checksum are chained in one call
+    with no intermediate lists or hex conversions between them.
+    """
+    versioned = b'\x00' + hash160(pubkey)
+    return versioned + sha256d_checksum(versioned)
+
+def addresses_from_pubkeys(pubkeys):
+    """
+    Convert a batch of uncompressed public keys to Bitcoin addresses.
+    
+    Hashing runs per key through pubkey_to_address_payload; base58 encoding
+    runs over the whole batch at once when Numba is available.
+    
+    Args:
+        pubkeys: List of 65-byte uncompressed public keys
+        
+    Returns:
+        List of Bitcoin addresses
+    """
+    if BASED58_AVAILABLE:
+        # based58 computes the checksum and the encoding in a single native call
+        return [based58.b58encode_check(b'\x00' + hash160(pubkey)).decode('ascii') for pubkey in pubkeys]
+    
+    payloads = [pubkey_to_address_payload(pubkey) for pubkey in pubkeys]
+    if not NUMBA_AVAILABLE:
+        return [base58_encode(payload) for payload in payloads]
+    
+    # Base58 encode the whole batch in one compiled call
+    encoded = np.frombuffer(b''.join(payloads), dtype=np.uint8).reshape(-1, PAYLOAD_LENGTH)
+    out = np.empty((len(payloads), MAX_ADDRESS_LENGTH), dtype=np.uint8)
+    lengths = np.empty(len(payloads), dtype=np.int64)
+    payloads_to_base58(encoded, out, lengths)
+    return [row[:length].tobytes().decode('ascii') for row, length in zip(out, lengths)]
+
+def public_key_to_address(public_key):
+    """Convert a 65-byte uncompressed public key to a Bitcoin address"""
+    return addresses_from_pubkeys([public_key])[0]
+
 def benchmark_fastecdsa():
     """Benchmark fastecdsa library for full address generation"""
     try:
         from fastecdsa import keys, curve
         
-        def generate_address(private_key):
-            # Generate public key
-            key = keys.get_public_key(int('0x' + private_key, 0), curve.secp256k1)
-            public_key = '04' + (hex(key.x)[2:] + hex(key.y)[2:]).zfill(128)
-            
-            # Convert to address
-            return public_key_to_address(public_key)
+        def generate_public_key(private_key):
+            key = keys.get_public_key(int.from_bytes(private_key, 'big'), curve.secp256k1)
+            return b'\x04' + key.x.to_bytes(32, 'big') + key.y.to_bytes(32, 'big')
         
         private_keys = generate_private_keys(NUM_ADDRESSES)
         
         start = time.time()
-        for pk in private_keys:
-            address = generate_address(pk)
+        public_keys = [generate_public_key(pk) for pk in iter_private_keys(private_keys)]
+        addresses = addresses_from_pubkeys(public_keys)
         end = time.time()
         
         return end - start
@@ -65,24 +200,22 @@ def benchmark_starkbank():
     try:
         from ellipticcurve.privateKey import PrivateKey
         
-        def generate_address(private_key):
-            # Generate public key
-            private_key_bytes = bytes.fromhex(private_key)
-            pk = PrivateKey.fromString(private_key_bytes)
-            public_key = '04' + pk.publicKey().toString().hex().upper()
-            
-            # Convert to address
-            return public_key_to_address(public_key)
+        def generate_public_key(private_key):
+            # starkbank parses private keys from hex and returns public keys as hex
+            pk = PrivateKey.fromString(private_key.hex())
+            return b'\x04' + bytes.fromhex(pk.publicKey().toString())
         
         private_keys = generate_private_keys(NUM_ADDRESSES)
         
         start = time.time()
-        for pk in private_keys:
+        public_keys = []
+        for pk in iter_private_keys(private_keys):
             try:
-                address = generate_address(pk)
+                public_keys.append(generate_public_key(pk))
             except Exception:
                 # Skip any problematic keys
                 continue
+        addresses = addresses_from_pubkeys(public_keys)
         end = time.time()
         
         return end - start
@@ -90,26 +223,51 @@ def benchmark_starkbank():
         print(f"starkbank-ecdsa error: {e}")
         return None
 
-def benchmark_coincurve():
-    """Benchmark coincurve library for full address generation"""
+def benchmark_coincurve(num_threads=1):
+    """
+    Benchmark coincurve library for full address generation.
+    
+    With num_threads > 1 only the key derivation is split across threads: hashlib
+    holds the GIL for inputs as small as a public key, so hashing cannot scale.
+    """
     try:
-        import coincurve
+        from coincurve._libsecp256k1 import ffi, lib
+        from coincurve.context import GLOBAL_CONTEXT
         
-        def generate_address(private_key):
-            # Generate public key
-            private_key_bytes = bytes.fromhex(private_key)
-            public_key = coincurve.PublicKey.from_secret(private_key_bytes)
-            public_key_hex = '04' + public_key.format(compressed=False)[1:].hex().upper()
-            
-            # Convert to address
-            return public_key_to_address(public_key_hex)
+        def generate_public_keys(private_keys):
+            # Derive the whole batch through libsecp256k1 with one context,
+            # serializing into one contiguous 65 * n byte buffer
+            ctx = GLOBAL_CONTEXT.ctx
+            num_keys = len(private_keys) // 32
+            pubkey = ffi.new('secp256k1_pubkey *')
+            output = ffi.new('unsigned char[]', 65 * num_keys)
+            output_len = ffi.new('size_t *')
+            secrets = ffi.from_buffer(private_keys)
+            for i in range(num_keys):
+                if not lib.secp256k1_ec_pubkey_create(ctx, pubkey, secrets + 32 * i):
+                    raise ValueError('Invalid private key')
+                output_len[0] = 65
+                lib.secp256k1_ec_pubkey_serialize(ctx, output + 65 * i, output_len, pubkey,
+                                                  lib.SECP256K1_EC_UNCOMPRESSED)
+            public_keys = memoryview(ffi.buffer(output))
+            return [public_keys[i:i + 65] for i in range(0, len(public_keys), 65)]
         
         private_keys = generate_private_keys(NUM_ADDRESSES)
         
-        start = time.time()
-        for pk in private_keys:
-            address = generate_address(pk)
-        end = time.time()
+        if num_threads == 1:
+            start = time.time()
+            addresses = addresses_from_pubkeys(generate_public_keys(private_keys))
+            end = time.time()
+            return end - start
+        
+        # Start the pool before timing so only the work itself is measured
+        chunks = split_private_keys(private_keys, num_threads)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=num_threads) as executor:
+            list(executor.map(generate_public_keys, [chunk[:32] for chunk in chunks]))
+            start = time.time()
+            public_keys = [pubkey for chunk in executor.map(generate_public_keys, chunks) for pubkey in chunk]
+            addresses = addresses_from_pubkeys(public_keys)
+            end = time.time()
         
         return end - start
     except ImportError:
@@ -149,6 +307,14 @@ def benchmark_all():
         slowest = max(results.items(), key=lambda x: x[1])
         speedup = slowest[1] / fastest[1]
         print(f"Speedup over {slowest[0]}: {speedup:.2f}x")
+    
+    # The comparison above is single-threaded for every library; coincurve with
+    # threaded key derivation is reported on its own
+    if NUM_THREADS > 1:
+        time_threaded = benchmark_coincurve(NUM_THREADS)
+        if time_threaded:
+            print(f"\ncoincurve, {NUM_THREADS} derivation threads: {time_threaded:.4f} seconds "
+                  f"({NUM_ADDRESSES/time_threaded:.2f} addr/sec)")
 
 if __name__ == "__main__":
     benchmark_all()
\ No newline at end of file
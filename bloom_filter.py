@@ -12,52 +12,119 @@ Usage:
 
 import sys
 import os
-import csv
-import hashlib
 import math
-import bitarray  # Install with: pip install bitarray
+import shutil
+import functools
+import itertools
+import struct
+import concurrent.futures
+import numpy as np  # Install with: pip install numpy
+import xxhash  # Install with: pip install xxhash
 from pathlib import Path
-from typing import List, Dict, Tuple, Set
+from typing import List, Dict, Tuple, Set, Optional, Union, Iterator, TYPE_CHECKING
+
+# pyarrow is only needed to parse the TSV, so it is imported inside those
+# functions; plutus.py can use BloomFilter without it
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# Try to import Numba to JIT-compile the Bloom filter hot path
+try:
+    from numba import njit, boolean, int64, uint64, void
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Try to import LMDB for indexed on-disk shard lookups
+try:
+    import lmdb
+    LMDB_AVAILABLE = True
+except ImportError:
+    LMDB_AVAILABLE = False
+
+# Seed for the second base hash (64-bit golden ratio constant)
+SECOND_HASH_SEED = 0x9E3779B97F4A7C15
+
+if NUMBA_AVAILABLE:
+    # Explicit signatures compile these at import instead of on first call.
+    # nogil lets several shards be filled from a thread pool.
+    # A non-zero mask means size is a power of two, so the modulus becomes an AND.
+    @njit(void(uint64[::1], uint64, uint64, int64, uint64, uint64), cache=True, nogil=True)
+    def _bloom_add(words, size, mask, k, h1, h2):
+        for i in range(k):
+            idx = h1 + np.uint64(i) * h2
+            idx = idx & mask if mask else idx % size
+            words[idx >> np.uint64(6)] |= np.uint64(1) << (idx & np.uint64(63))
+    
+    @njit(boolean(uint64[::1], uint64, uint64, int64, uint64, uint64), cache=True, nogil=True)
+    def _bloom_contains(words, size, mask, k, h1, h2):
+        for i in range(k):
+            idx = h1 + np.uint64(i) * h2
+            idx = idx & mask if mask else idx % size
+            if not (words[idx >> np.uint64(6)] >> (idx & np.uint64(63))) & np.uint64(1):
+                return False
+        return True
 
 class BloomFilter:
     def __init__(self, size: int, hash_count: int):
         """Initialize a Bloom filter with given size and number of hash functions."""
         self.size = size
         self.hash_count = hash_count
-        self.bit_array = bitarray.bitarray(size)
-        self.bit_array.setall(0)  # Initialize all bits to 0
+        # Power-of-two sizes reduce indexes with a mask instead of a modulus (0 = no mask)
+        self.mask = size - 1 if size & (size - 1) == 0 else 0
+        # Bits are packed into 64-bit words, all initialized to 0
+        self.words = np.zeros((size + 63) // 64, dtype=np.uint64)
+        self._steps = np.arange(hash_count, dtype=np.uint64)
+    
+    def _hash(self, item: Union[str, bytes]) -> Tuple[int, int]:
+        """
+        Generate the two base hashes for the item.
+        
+        The k bit indexes are derived as (h1 + i * h2) % size (Kirsch-Mitzenmacher
+        double hashing), so each item is only hashed twice regardless of k.
+        """
+        data = item.encode() if isinstance(item, str) else item
+        return xxhash.xxh64_intdigest(data, seed=0), xxhash.xxh64_intdigest(data, seed=SECOND_HASH_SEED)
     
-    def _hash(self, item: str, seed: int) -> int:
-        """Generate a hash for the item with a specific seed."""
-        h = hashlib.md5(f"{item}{seed}".encode()).hexdigest()
-        return int(h, 16) % self.size
+    def _indexes(self, item: Union[str, bytes]) -> np.ndarray:
+        """Compute all k bit indexes for the item at once (uint64 arithmetic wraps)."""
+        h1, h2 = self._hash(item)
+        indexes = np.uint64(h1) + self._steps * np.uint64(h2)
+        if self.mask:
+            return indexes & np.uint64(self.mask)
+        return indexes % np.uint64(self.size)
     
-    def add(self, item: str) -> None:
+    def add(self, item: Union[str, bytes]) -> None:
         """Add an item to the Bloom filter."""
-        for i in range(self.hash_count):
-            index = self._hash(item, i)
-            self.bit_array[index] = 1
+        if NUMBA_AVAILABLE:
+            h1, h2 = self._hash(item)
+            _bloom_add(self.words, self.size, self.mask, self.hash_count, h1, h2)
+            return
+        indexes = self._indexes(item)
+        np.bitwise_or.at(self.words, indexes >> 6, np.uint64(1) << (indexes & 63))
     
-    def might_contain(self, item: str) -> bool:
+    def might_contain(self, item: Union[str, bytes]) -> bool:
         """Check if an item might be in the Bloom filter."""
-        for i in range(self.hash_count):
-            index = self._hash(item, i)
-            if not self.bit_array[index]:
-                return False
-        return True
+        if NUMBA_AVAILABLE:
+            h1, h2 = self._hash(item)
+            return _bloom_contains(self.words, self.size, self.mask, self.hash_count, h1, h2)
+        indexes = self._indexes(item)
+        return bool(((self.words[indexes >> 6] >> (indexes & 63)) & 1).all())
     
     def save(self, filename: str) -> None:
         """Save the Bloom filter to a file."""
-        with open(filename, 'wb') as f:
-            self.bit_array.tofile(f)
+        self.words.tofile(filename)
     
     @classmethod
     def load(cls, filename: str, size: int, hash_count: int) -> 'BloomFilter':
         """Load a Bloom filter from a file."""
         bloom = cls(size, hash_count)
-        with open(filename, 'rb') as f:
-            bloom.bit_array = bitarray.bitarray()
-            bloom.bit_array.fromfile(f)
+        words = np.fromfile(filename, dtype=np.uint64)
+        # The kernels index words without bounds checks, so the file must match size
+        if len(words) != len(bloom.words):
+            raise ValueError(f"Bloom filter file {filename} holds {len(words)} words, "
+                             f"expected {len(bloom.words)} for {size} bits")
+        bloom.words = words
         return bloom
     
     @classmethod
@@ -65,6 +132,9 @@ class BloomFilter:
         """
         Create a Bloom filter with optimal size and hash count.
         
+        The bit count is rounded up to the next power of two so indexes can be
+        reduced with a mask; the extra bits only lower the false positive rate.
+        
         Args:
             n: Expected number of elements
             p: False positive probability
@@ -74,20 +144,82 @@ class BloomFilter:
         """
         m = int(-n * math.log(p) / (math.log(2) ** 2))  # Number of bits
         k = math.ceil((m / n) * math.log(2))            # Number of hash functions
-        return cls(size=m, hash_count=k)
+        return cls(size=1 << max(6, (m - 1).bit_length()), hash_count=k)
 
 def get_shard_key(address: str, num_shards: int) -> int:
-    """Determine which shard an address belongs to."""
-    # Use first character of address for simple sharding
-    # For more even distribution, could use a hash function
-    if address.startswith('1'):  # P2PKH addresses
-        # Use the last few characters for sharding, similar to your load function
-        hash_val = int(hashlib.md5(address[-8:].encode()).hexdigest(), 16)
-        return hash_val % num_shards
-    else:
-        # For non-P2PKH addresses, use a hash of the full address
-        hash_val = int(hashlib.md5(address.encode()).hexdigest(), 16)
-        return hash_val % num_shards
+    """Determine which shard an address belongs to (num_shards must be a power of two)."""
+    return xxhash.xxh3_64_intdigest(address.encode()) & (num_shards - 1)
+
+def read_num_shards(db_path: Path) -> int:
+    """Read the shard count recorded in shards.meta, or 0 if there is none."""
+    meta_file = db_path / "shards.meta"
+    if not meta_file.exists():
+        return 0
+    with open(meta_file, 'r') as f:
+        for line in f:
+            key, value = line.strip().split('=')
+            if key == 'num_shards':
+                return int(value)
+    return 0
+
+def _csv_options(skip_header: bool, invalid_row_handler) -> Dict[str, object]:
+    """Build pyarrow CSV options for the two-column address/balance TSV."""
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    return {
+        'read_options': pacsv.ReadOptions(column_names=['address', 'balance'],
+                                          skip_rows=1 if skip_header else 0),
+        'parse_options': pacsv.ParseOptions(delimiter='\t',
+                                            invalid_row_handler=invalid_row_handler),
+        'convert_options': pacsv.ConvertOptions(column_types={'address': pa.string(),
+                                                              'balance': pa.string()}),
+    }
+
+def _read_records(source, skip_header: bool) -> Iterator[Tuple[int, 'pa.RecordBatch']]:
+    """
+    Read the address/balance TSV as (rows read, record batch) pairs.
+    
+    pyarrow rejects rows whose column count differs from the two-column schema;
+    those are recovered from their text using their first two fields, so rows
+    with extra columns are kept and rows with fewer than two are only counted.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    rejected = []
+    
+    def handle_invalid_row(row):
+        rejected.append(row.text)
+        return 'skip'
+    
+    with pacsv.open_csv(source, **_csv_options(skip_header, handle_invalid_row)) as reader:
+        for batch in itertools.chain(reader, [None]):
+            if batch is not None:
+                yield batch.num_rows, batch
+            if rejected:
+                rows = [text.rstrip('\r\n').split('\t') for text in rejected]
+                rows = [fields for fields in rows if len(fields) >= 2]
+                extra = pa.record_batch([pa.array([fields[0] for fields in rows], pa.string()),
+                                         pa.array([fields[1] for fields in rows], pa.string())],
+                                        names=['address', 'balance'])
+                yield len(rejected), extra
+                rejected.clear()
+
+def _valid_records(batch: 'pa.RecordBatch') -> 'pa.RecordBatch':
+    """
+    Keep records whose balance is INSIDE the range 80000000000 > x > 100000000.
+    
+    Balances are parsed like int(): surrounding whitespace and a leading '+' are
+    allowed. Non-numeric balances are skipped, and the balance column is returned as int64.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    balance = pc.replace_substring_regex(pc.utf8_trim_whitespace(batch.column('balance')),
+                                         pattern=r'^\+', replacement='')
+    # At most 18 digits always fits in an int64
+    numeric = pc.match_substring_regex(balance, r'^[0-9]{1,18}$')
+    balance = pc.cast(pc.if_else(numeric, balance, pa.scalar(None, pa.string())), pa.int64())
+    mask = pc.and_(pc.greater(balance, 100000000), pc.less(balance, 80000000000))
+    return pa.record_batch([batch.column('address'), balance], names=['address', 'balance']).filter(mask)
 
 def count_valid_records(file_path: str) -> int:
     """
@@ -96,82 +228,203 @@ def count_valid_records(file_path: str) -> int:
     Valid records have a balance between 100,000,000 and 80,000,000,000.
     """
     valid_count = 0
-    with open(file_path, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f, delimiter='\t')
-        next(reader)  # Skip header
-        for row in reader:
-            if len(row) >= 2:
-                try:
-                    balance = int(row[1])
-                    # Keep records where balance is INSIDE the range 80000000000 > x > 100000000
-                    if balance > 100000000 and balance < 80000000000:
-                        valid_count += 1
-                except ValueError:
-                    continue
+    for _, batch in _read_records(str(file_path), skip_header=True):
+        valid_count += _valid_records(batch).num_rows
     return valid_count
 
-def process_records_sharded(
-    file_path: str, 
-    output_dir: Path, 
-    num_shards: int, 
-    bloom_filters: Dict[int, BloomFilter]
-) -> Tuple[int, int]:
+def _chunk_offsets(file_path: str, num_chunks: int) -> List[Tuple[int, int]]:
     """
-    Process records from the TSV file, add valid ones to sharded text files and Bloom filters.
+    Split the TSV file (after its header) into roughly equal byte ranges.
+    
+    Every range starts at the beginning of a line and ends just after a newline,
+    so each one can be parsed independently.
+    """
+    file_size = os.path.getsize(file_path)
+    with open(file_path, 'rb') as f:
+        f.readline()  # Skip header
+        data_start = f.tell()
+        chunk_size = max(1, (file_size - data_start) // num_chunks)
+        
+        offsets = [data_start]
+        for i in range(1, num_chunks):
+            f.seek(max(data_start + i * chunk_size, offsets[-1]))
+            f.readline()  # Advance to the start of the next line
+            offset = f.tell()
+            if offset >= file_size:
+                break
+            if offset > offsets[-1]:
+                offsets.append(offset)
+        offsets.append(file_size)
+    
+    return list(zip(offsets[:-1], offsets[1:]))
+
+def write_shard_store(shard_file: Path, store_file: Path) -> None:
+    """
+    Write a shard's records into an LMDB key-value store (address -> balance).
+    
+    Balances are stored as little-endian unsigned 64-bit integers.
+    """
+    if store_file.exists():
+        store_file.unlink()
+    map_size = max(1 << 20, shard_file.stat().st_size * 8)
+    env = lmdb.open(str(store_file), map_size=map_size, subdir=False, lock=False)
+    try:
+        with env.begin(write=True) as txn, open(shard_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                address, balance = line.rstrip('\n').split('\t')
+                txn.put(address.encode(), struct.pack('<Q', int(balance)), overwrite=False)
+    finally:
+        env.close()
+
+def _process_chunk(
+    file_path: str,
+    output_dir: Path,
+    chunk_id: int,
+    start: int,
+    end: int,
+    num_shards: int,
+    bloom_params: Dict[int, Tuple[int, int]]
+) -> Tuple[int, int, Dict[int, np.ndarray]]:
+    """
+    Process one byte range of the TSV file into per-chunk shard part-files.
     
     Returns:
-        Tuple of (total processed records, added records)
+        Tuple of (processed records, added records, Bloom filter words per shard)
     """
-    # Create shard file handles
+    import pyarrow as pa
+    bloom_filters = {i: BloomFilter(size, hash_count) for i, (size, hash_count) in bloom_params.items()}
     shard_files = {}
     for i in range(num_shards):
-        shard_path = output_dir / f"shard_{i}.txt"
-        shard_files[i] = open(shard_path, 'w', encoding='utf-8')
+        shard_files[i] = open(output_dir / f"shard_{i}.part{chunk_id}", 'w', encoding='utf-8')
     
     processed = 0
     added = 0
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f, delimiter='\t')
-            header = next(reader)  # Skip header
-            
-            for row in reader:
-                processed += 1
-                if processed % 1000000 == 0:
-                    print(f"Processed {processed} records...")
+        # Parse this byte range straight out of a memory map, one record batch at a time
+        with pa.memory_map(file_path) as source:
+            chunk = pa.BufferReader(source.read_at(end - start, start))
+            for rows_read, batch in _read_records(chunk, skip_header=False):
+                processed += rows_read
+                valid = _valid_records(batch)
+                addresses = valid.column('address').to_pylist()
+                balances = valid.column('balance').to_pylist()
+                
+                for address, balance in zip(addresses, balances):
+                    # Determine which shard this address belongs to
+                    shard_id = get_shard_key(address, num_shards)
+                    
+                    # Write to the appropriate shard part-file
+                    shard_files[shard_id].write(f"{address}\t{balance}\n")
+                    
+                    # Add to the appropriate Bloom filter
+                    bloom_filters[shard_id].add(address)
                 
-                if len(row) >= 2:
-                    try:
-                        address = row[0]
-                        balance = int(row[1])
-                        
-                        # Keep records where balance is INSIDE the range 80000000000 > x > 100000000
-                        if balance > 100000000 and balance < 80000000000:
-                            # Determine which shard this address belongs to
-                            shard_id = get_shard_key(address, num_shards)
-                            
-                            # Write to the appropriate shard file
-                            shard_files[shard_id].write(f"{address}\t{balance}\n")
-                            
-                            # Add to the appropriate Bloom filter
-                            bloom_filters[shard_id].add(address)
-                            
-                            added += 1
-                                
-                    except ValueError:
-                        continue
+                added += len(addresses)
+        print(f"Processed {processed} records in chunk {chunk_id}")
     finally:
-        # Close all shard files
+        # Close all shard part-files
         for file in shard_files.values():
             file.close()
     
+    return processed, added, {i: bloom.words for i, bloom in bloom_filters.items()}
+
+def process_records_sharded(
+    file_path: str, 
+    output_dir: Path, 
+    num_shards: int, 
+    bloom_filters: Dict[int, BloomFilter],
+    max_workers: Optional[int] = None
+) -> Tuple[int, int]:
+    """
+    Process records from the TSV file, add valid ones to sharded text files and Bloom filters.
+    
+    The file is split into line-aligned byte ranges that are parsed in parallel
+    worker processes. Each worker writes its own shard part-files and Bloom filters,
+    which are then concatenated and OR-merged per shard.
+    
+    Returns:
+        Tuple of (total processed records, added records)
+    """
+    max_workers = max_workers or os.cpu_count()
+    chunks = _chunk_offsets(str(file_path), max_workers)
+    bloom_params = {i: (bloom.size, bloom.hash_count) for i, bloom in bloom_filters.items()}
+    
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_process_chunk, str(file_path), output_dir, chunk_id, start, end,
+                            num_shards, bloom_params)
+            for chunk_id, (start, end) in enumerate(chunks)
+        ]
+        # OR each chunk's Bloom filters in as it finishes, so only one set of
+        # chunk filters is held at a time
+        processed = added = 0
+        for future in concurrent.futures.as_completed(futures):
+            chunk_processed, chunk_added, chunk_words = future.result()
+            processed += chunk_processed
+            added += chunk_added
+            for i, words in chunk_words.items():
+                np.bitwise_or(bloom_filters[i].words, words, out=bloom_filters[i].words)
+            del chunk_words
+            futures.remove(future)
+    
+    # Concatenate the shard part-files, keeping input order
+    for i in range(num_shards):
+        with open(output_dir / f"shard_{i}.txt", 'w', encoding='utf-8') as shard_file:
+            for chunk_id in range(len(chunks)):
+                part_path = output_dir / f"shard_{i}.part{chunk_id}"
+                with open(part_path, 'r', encoding='utf-8') as part_file:
+                    shutil.copyfileobj(part_file, shard_file)
+                part_path.unlink()
+        
+        if LMDB_AVAILABLE:
+            write_shard_store(output_dir / f"shard_{i}.txt", output_dir / f"shard_{i}.lmdb")
+    
     return processed, added
 
+# Bloom filters and shard contents loaded by load_database_efficiently,
+# keyed by (database directory, shard id), so each shard is read from disk once
+_bloom_cache: Dict[Tuple[str, int], BloomFilter] = {}
+_shard_cache: Dict[Tuple[str, int], Dict[str, int]] = {}
+_store_cache: Dict[Tuple[str, int], 'lmdb.Environment'] = {}
+
+@functools.lru_cache(maxsize=128)
+def _read_params(params_file: Path) -> Dict[str, int]:
+    """Read a shard's Bloom filter parameters."""
+    params = {}
+    with open(params_file, 'r') as f:
+        for line in f:
+            key, value = line.strip().split('=')
+            params[key] = int(value)
+    return params
+
+@functools.lru_cache(maxsize=128)
+def _read_num_shards(db_key: str) -> int:
+    """Read a database directory's shard count from shards.meta once."""
+    return read_num_shards(Path(db_key))
+
+def _read_shard(shard_file: Path) -> Dict[str, int]:
+    """Read a shard file into an address -> balance mapping."""
+    shard = {}
+    with open(shard_file, 'r') as f:
+        for line in f:
+            parts = line.strip().split('\t')
+            if len(parts) >= 2:
+                try:
+                    balance = int(parts[1])
+                except ValueError:
+                    balance = 0
+                shard.setdefault(parts[0], balance)
+    return shard
+
 def load_database_efficiently(db_dir: str, address: str) -> int:
     """
     Load balance for an address efficiently using sharded database and Bloom filters.
     
+    Positive Bloom filter hits are resolved through the shard's LMDB store when
+    one exists, falling back to the shard text file otherwise. Bloom filters,
+    stores and shard contents are cached after their first use.
+    
     Args:
         db_dir: Directory containing sharded database files
         address: Bitcoin address to look up
@@ -180,7 +433,7 @@ def load_database_efficiently(db_dir: str, address: str) -> int:
         Balance for the address or 0 if not found
     """
     db_path = Path(db_dir)
-    num_shards = len([f for f in db_path.glob("shard_*.txt")])
+    num_shards = _read_num_shards(str(db_path))
     
     if num_shards == 0:
         print("No database shards found")
@@ -188,42 +441,38 @@ def load_database_efficiently(db_dir: str, address: str) -> int:
     
     # Determine which shard to check
     shard_id = get_shard_key(address, num_shards)
+    cache_key = (str(db_path), shard_id)
     
-    # Check if Bloom filter exists
-    bloom_file = db_path / f"shard_{shard_id}.bloom"
-    params_file = db_path / f"shard_{shard_id}.params"
+    # Load the Bloom filter on first use
+    if cache_key not in _bloom_cache:
+        bloom_file = db_path / f"shard_{shard_id}.bloom"
+        params_file = db_path / f"shard_{shard_id}.params"
+        if bloom_file.exists() and params_file.exists():
+            params = _read_params(params_file)
+            _bloom_cache[cache_key] = BloomFilter.load(str(bloom_file), params['m'], params['k'])
     
-    if bloom_file.exists() and params_file.exists():
-        # Load Bloom filter parameters
-        params = {}
-        with open(params_file, 'r') as f:
-            for line in f:
-                key, value = line.strip().split('=')
-                params[key] = int(value)
-        
-        # Load Bloom filter
-        bloom = BloomFilter.load(str(bloom_file), params['m'], params['k'])
-        
-        # Check if address might be in the filter
-        if not bloom.might_contain(address):
-            return 0  # Definitely not in the database
+    # Check if address might be in the filter
+    bloom = _bloom_cache.get(cache_key)
+    if bloom is not None and not bloom.might_contain(address):
+        return 0  # Definitely not in the database
     
-    # Address might be in the database, check the shard file
-    shard_file = db_path / f"shard_{shard_id}.txt"
-    if not shard_file.exists():
-        return 0
+    # Address might be in the database, check the shard's LMDB store
+    store_file = db_path / f"shard_{shard_id}.lmdb"
+    if LMDB_AVAILABLE and (cache_key in _store_cache or store_file.exists()):
+        if cache_key not in _store_cache:
+            _store_cache[cache_key] = lmdb.open(str(store_file), readonly=True, lock=False, subdir=False)
+        with _store_cache[cache_key].begin() as txn:
+            raw = txn.get(address.encode())
+        return struct.unpack('<Q', raw)[0] if raw else 0
     
-    # Search for the address in the shard file
-    with open(shard_file, 'r') as f:
-        for line in f:
-            parts = line.strip().split('\t')
-            if len(parts) >= 2 and parts[0] == address:
-                try:
-                    return int(parts[1])
-                except ValueError:
-                    return 0
+    # No store for this shard, check the shard contents
+    if cache_key not in _shard_cache:
+        shard_file = db_path / f"shard_{shard_id}.txt"
+        if not shard_file.exists():
+            return 0
+        _shard_cache[cache_key] = _read_shard(shard_file)
     
-    return 0  # Address not found
+    return _shard_cache[cache_key].get(address, 0)
 
 def main():
     if len(sys.argv) != 3:
@@ -241,7 +490,10 @@ def main():
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Number of shards to create
-    num_shards = 128  # Adjust based on your needs
+    num_shards = 128  # Adjust based on your needs (must be a power of two)
+    if num_shards <= 0 or num_shards & (num_shards - 1):
+        print(f"Error: Number of shards must be a power of two, got {num_shards}.")
+        sys.exit(1)
     
     # First pass: count valid records for Bloom filter sizing
     print("Counting valid records...")
@@ -272,6 +524,10 @@ def main():
         with open(params_file, 'w') as f:
             f.write(f"k={bloom.hash_count}\nm={bloom.size}\nn={records_per_shard}")
     
+    # Record the shard count so lookups don't have to scan the directory
+    with open(output_dir / "shards.meta", 'w') as f:
+        f.write(f"num_shards={num_shards}")
+    
     print(f"Done! Processed {processed} records, added {added} records to {num_shards} shards.")
     print(f"Sharded files and Bloom filters saved to {output_dir}")
 
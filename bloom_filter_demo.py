@@ -4,12 +4,16 @@ Demonstrate Bloom filter usage for efficient Bitcoin address database lookups
 """
 
 import os
+import mmap
 import time
 import sys
 import random
 import string
 import psutil
-from pybloom_live import ScalableBloomFilter
+from bloom_filter import BloomFilter
+
+# Target false positive probability for the Bloom filter
+ERROR_RATE = 0.000001
 
 # Set the path to the database directory
 DATABASE = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'database/11_13_2022')
@@ -20,29 +24,48 @@ def get_memory_usage():
     mem_info = process.memory_info()
     return mem_info.rss / 1024 / 1024  # Convert to MB
 
+def count_lines(file_paths):
+    """Count the lines in the database files, an upper bound on the number of addresses"""
+    total = 0
+    for file_path in file_paths:
+        with open(file_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                total += chunk.count(b'\n')
+    return total
+
 def load_database_with_bloom_filter(substring_length=6):
     """Load database into a Bloom filter for efficient lookups"""
     print('Reading database files into Bloom filter...')
     
-    # Create a scalable Bloom filter with a low false positive probability
-    # This will automatically scale as more items are added
-    bloom_filter = ScalableBloomFilter(initial_capacity=1000000, error_rate=0.000001)
+    # Get all database files
+    file_paths = [os.path.join(DATABASE, filename) for filename in os.listdir(DATABASE)]
+    
+    # Size a single Bloom filter for the whole database up front, so every
+    # add and lookup touches one bit array instead of a stack of growing layers
+    bloom_filter = BloomFilter.create_optimal(max(1, count_lines(file_paths)), p=ERROR_RATE)
     
     total_addresses = 0
     start_time = time.time()
     start_memory = get_memory_usage()
     
-    # Get all database files
-    file_paths = [os.path.join(DATABASE, filename) for filename in os.listdir(DATABASE)]
-    
     # Process each file
     for file_path in file_paths:
         file_total = 0
         try:
-            with open(file_path, 'r') as file:
-                for line in file:
-                    address = line.strip()
-                    if address and address.startswith('1'):  # Only process P2PKH addresses
+            if os.path.getsize(file_path) == 0:
+                continue
+            # Memory-map the file and slice lines out as bytes, skipping str decoding
+            with open(file_path, 'rb') as file, \
+                    mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pos = 0
+                end = len(mm)
+                while pos < end:
+                    nl = mm.find(b'\n', pos)
+                    if nl < 0:
+                        nl = end
+                    address = mm[pos:nl].rstrip()
+                    pos = nl + 1
+                    if address[:1] == b'1':  # Only process P2PKH addresses
                         # Add the suffix to the Bloom filter
                         bloom_filter.add(address[-substring_length:])
                         file_total += 1
@@ -81,7 +104,7 @@ def benchmark_bloom_filter(bloom_filter, num_lookups=1000000):
     start_time = time.time()
     
     for suffix in random_suffixes:
-        _ = suffix in bloom_filter
+        _ = bloom_filter.might_contain(suffix)
     
     end_time = time.time()
     total_time = end_time - start_time
@@ -119,7 +142,7 @@ def compare_with_set(bloom_filter, num_lookups=1000000):
     start_time = time.time()
     
     for suffix in random_suffixes:
-        _ = suffix in bloom_filter
+        _ = bloom_filter.might_contain(suffix)
     
     end_time = time.time()
     bloom_time = end_time - start_time
@@ -134,7 +157,7 @@ def compare_with_set(bloom_filter, num_lookups=1000000):
     
     # Memory usage comparison
     import sys
-    bloom_size = sys.getsizeof(bloom_filter)
+    bloom_size = bloom_filter.words.nbytes
     set_size = sys.getsizeof(test_set)
     
     print(f"\nBloom filter size: {bloom_size/1024/1024:.2f} MB")
@@ -160,14 +183,14 @@ def test_false_positives(bloom_filter, num_tests=1000000):
     false_positives = 0
     for addr in random_addresses:
         # Check if the address suffix is in the filter
-        if addr[-6:] in bloom_filter:
+        if bloom_filter.might_contain(addr[-6:]):
             false_positives += 1
     
     false_positive_rate = false_positives / num_tests
     print(f"False positive tests: {num_tests:,}")
     print(f"False positives: {false_positives:,}")
     print(f"Measured false positive rate: {false_positive_rate:.8f}")
-    print(f"Expected false positive rate: {bloom_filter.error_rate:.8f}")
+    print(f"Expected false positive rate: {ERROR_RATE:.8f}")
     print(f"This means approximately 1 in {1/false_positive_rate:.0f} lookups might incorrectly return True")
 
 def main():
@@ -205,8 +228,8 @@ def main():
     print("\nBloom Filter Summary:")
     print(f"Total addresses loaded: {total_addresses:,}")
     print(f"Substring length: {substring_length}")
-    print(f"Estimated false positive probability: {bloom_filter.error_rate:.8f}")
-    print(f"This means approximately 1 in {1/bloom_filter.error_rate:.0f} lookups might incorrectly return True")
+    print(f"Estimated false positive probability: {ERROR_RATE:.8f}")
+    print(f"This means approximately 1 in {1/ERROR_RATE:.0f} lookups might incorrectly return True")
     print("\nTo use Bloom filters in the main Plutus script, run:")
     print("python3 plutus.py use_bloom=1")
 